@@ -14,7 +14,7 @@ from tests.docker_fixtures import (
     check_docker_available,
 )
 
-from flext_ldif import flext_ldif_parse, flext_ldif_validate
+from flext_ldif import FlextLdifEntry, flext_ldif_validate
 
 
 def test_with_docker_container() -> bool | None:
@@ -34,15 +34,25 @@ def test_with_docker_container() -> bool | None:
         # Start container (this will populate it with test data)
         manager.start_container()
 
-        # Export LDIF data from container
-        ldif_data = manager.get_ldif_export()
-
-        if not ldif_data:
+        # Stream entries straight out of the container export - the raw
+        # LDIF is never buffered or decoded as a whole. Classification is
+        # fused into the same pass instead of re-scanning the list per type.
+        entries: list[FlextLdifEntry] = []
+        person_entries: list[FlextLdifEntry] = []
+        group_count = 0
+        ou_count = 0
+        for entry in manager.iter_ldif_export():
+            entries.append(entry)
+            if entry.is_person():
+                person_entries.append(entry)
+            if entry.has_object_class("groupOfNames"):
+                group_count += 1
+            if entry.has_object_class("organizationalUnit"):
+                ou_count += 1
+
+        if not entries:
             return False
 
-        # Test parsing
-        entries = flext_ldif_parse(ldif_data)
-
         # Constants for testing
         max_entries_to_show = 3
 
@@ -54,22 +64,11 @@ def test_with_docker_container() -> bool | None:
         if len(entries) > max_entries_to_show:
             pass
 
-        # Test validation - parse first, then validate
-        entries = flext_ldif_parse(ldif_data)
+        # Test validation on the already parsed entries
         flext_ldif_validate(entries)
 
-        # Usar API real para filtrar pessoas e grupos
-        api = __import__("flext_ldif").flext_ldif.FlextLdifAPI
-        api = api()
-
-        # Filter pessoas usando API real com modern FlextResult pattern
-        person_filter_result = api.filter_persons(entries)
-        person_entries = person_filter_result.unwrap_or([])
-        len(person_entries)
-
-        # Contar entries por objectClass usando API real
-        sum(1 for entry in entries if entry.has_object_class("groupOfNames"))
-        sum(1 for entry in entries if entry.has_object_class("organizationalUnit"))
+        # Per-type totals were collected while streaming
+        _ = (len(person_entries), group_count, ou_count)
 
         return True
 
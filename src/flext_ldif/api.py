@@ -273,7 +273,7 @@ class FlextLdifAPI:
             FlextResult containing filtered person entries.
 
         """
-        filtered = [entry for entry in entries if entry.is_person_entry()]
+        filtered = [entry for entry in entries if entry.is_person()]
         return FlextResult[list[FlextLdifEntry]].ok(filtered)
 
     def filter_groups(
@@ -289,7 +289,7 @@ class FlextLdifAPI:
             FlextResult containing filtered group entries.
 
         """
-        filtered = [entry for entry in entries if entry.is_group_entry()]
+        filtered = [entry for entry in entries if entry.is_group()]
         return FlextResult[list[FlextLdifEntry]].ok(filtered)
 
     def filter_organizational_units(
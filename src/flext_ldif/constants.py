@@ -7,7 +7,11 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from typing import Final
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 # =============================================================================
 # LDIF FORMAT CONSTANTS (RFC 2849)
@@ -90,6 +94,29 @@ LDAP_OU_CLASSES: Final[frozenset[str]] = frozenset(
     },
 )
 
+# Well-known objectClasses (lowercased, sorted for stable bit positions) mapped
+# to a single bit each so entries can answer membership checks with one AND
+LDAP_OBJECTCLASS_BITS: Final[Mapping[str, int]] = MappingProxyType({
+    object_class: 1 << bit
+    for bit, object_class in enumerate(
+        sorted({
+            object_class.lower()
+            for object_class in LDAP_PERSON_CLASSES
+            | LDAP_GROUP_CLASSES
+            | LDAP_OU_CLASSES
+            | {"domain", "dcObject", "organization"}
+        }),
+    )
+})
+
+# Precombined masks so person/group checks are a single AND per entry
+LDAP_PERSON_CLASS_MASK: Final[int] = sum(
+    LDAP_OBJECTCLASS_BITS[object_class.lower()] for object_class in LDAP_PERSON_CLASSES
+)
+LDAP_GROUP_CLASS_MASK: Final[int] = sum(
+    LDAP_OBJECTCLASS_BITS[object_class.lower()] for object_class in LDAP_GROUP_CLASSES
+)
+
 # Backward Compatibility Aliases (DEPRECATED - use LDAP_ prefixed versions)
 PERSON_OBJECT_CLASSES: Final[frozenset[str]] = LDAP_PERSON_CLASSES
 GROUP_OBJECT_CLASSES: Final[frozenset[str]] = LDAP_GROUP_CLASSES
@@ -840,9 +867,12 @@ __all__ = [
     # LDAP Attributes (NEW - consolidated naming)
     "LDAP_DN_ATTRIBUTES",
     "LDAP_GROUP_CLASSES",
+    "LDAP_GROUP_CLASS_MASK",
+    "LDAP_OBJECTCLASS_BITS",
     "LDAP_OU_CLASSES",
     # LDAP Object Classes (NEW - consolidated naming)
     "LDAP_PERSON_CLASSES",
+    "LDAP_PERSON_CLASS_MASK",
     # LDIF Change Types
     "LDIF_CHANGE_TYPES",
     "LIBRARY_DESCRIPTION",
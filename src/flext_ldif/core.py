@@ -8,7 +8,7 @@ SPDX-License-Identifier: MIT
 from __future__ import annotations
 
 import re
-from collections.abc import Callable as _Callable
+from collections.abc import Callable as _Callable, Iterable, Iterator
 from functools import reduce
 from pathlib import Path
 
@@ -16,6 +16,7 @@ from flext_core import FlextResult, FlextValidationError, get_logger
 
 from flext_ldif.constants import FlextLdifCoreConstants
 from flext_ldif.format_handler_service import (
+    FlextLDIFParser,
     modernized_ldif_parse,
     modernized_ldif_write,
 )
@@ -94,6 +95,34 @@ class TLdif:
                 FlextLdifCoreConstants.PARSE_FAILED_MSG.format(error=e),
             )
 
+    @classmethod
+    def iter_parse(cls, stream: Iterable[str]) -> Iterator[FlextLdifEntry]:
+        """Lazily parse LDIF records from a line stream into domain entities.
+
+        Unlike ``parse`` nothing is accumulated: each entry is yielded as soon
+        as its record is complete, so callers can filter or write while the
+        input is still being read.
+
+        Args:
+            stream: Text stream or iterable of LDIF lines (``io.StringIO``,
+                open file, ``io.TextIOWrapper`` over a subprocess pipe)
+
+        Yields:
+            FlextLdifEntry: Parsed entries in input order
+
+        Raises:
+            ValueError: If a record is malformed or cannot be converted
+
+        """
+        for dn, attrs in FlextLDIFParser(stream).parse():
+            try:
+                entry = FlextLdifFactory.create_entry(dn, attrs)
+            except (ValueError, TypeError, FlextValidationError) as e:
+                raise ValueError(
+                    FlextLdifCoreConstants.FAILED_TO_CREATE_ENTRY_MSG.format(error=e)
+                ) from e
+            yield entry
+
     @classmethod
     def _parse_with_modernized_ldif(
         cls,
@@ -140,17 +169,18 @@ class TLdif:
                     def process_entry(
                         entries_list: list[FlextLdifEntry],
                     ) -> FlextResult[list[FlextLdifEntry]]:
-                        entry_result = FlextLdifFactory.create_entry(dn, attrs)
-                        if entry_result.is_failure:
+                        try:
+                            entry = FlextLdifFactory.create_entry(dn, attrs)
+                        except (ValueError, TypeError, FlextValidationError) as e:
                             return FlextResult[list[FlextLdifEntry]].fail(
                                 FlextLdifCoreConstants.FAILED_TO_CREATE_ENTRY_MSG.format(
-                                    error=entry_result.error
+                                    error=e
                                 )
                             )
-                        return FlextResult[list[FlextLdifEntry]].ok([
-                            *entries_list,
-                            entry_result.value,
-                        ])
+                        # Append in place: rebuilding the accumulator per entry
+                        # made conversion quadratic in the entry count
+                        entries_list.append(entry)
+                        return FlextResult[list[FlextLdifEntry]].ok(entries_list)
 
                     return acc.flat_map(process_entry)
 
@@ -10,7 +10,7 @@ from __future__ import annotations
 import base64
 import re
 from collections import OrderedDict
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from urllib.parse import urlparse
 
 import urllib3
@@ -233,13 +233,14 @@ class FlextLDIFWriter:
 class FlextLDIFParser:
     """Modernized LDIF parser with full string compatibility.
 
-    Reads LDIF entry records from string input with enhanced error handling
-    and zero bytes/string compatibility issues.
+    Reads LDIF entry records from string input or any iterable of lines
+    (open files, ``io.StringIO``, pipes) with enhanced error handling and
+    zero bytes/string compatibility issues.
     """
 
     def __init__(
         self,
-        input_content: str,
+        input_content: str | Iterable[str],
         ignored_attr_types: list[str] | None = None,
         encoding: str = "utf-8",
         *,
@@ -248,13 +249,17 @@ class FlextLDIFParser:
         """Initialize LDIF parser.
 
         Args:
-            input_content: LDIF content as string
+            input_content: LDIF content as string or iterable of lines
             ignored_attr_types: List of attribute types to ignore
             encoding: Character encoding
             strict: If False, log warnings instead of raising exceptions
 
         """
-        self._input_lines = input_content.splitlines()
+        self._input_lines: Iterable[str] = (
+            input_content.splitlines()
+            if isinstance(input_content, str)
+            else input_content
+        )
         self._ignored_attr_types = lower_list(ignored_attr_types)
         self._encoding = encoding
         self._strict = strict
@@ -267,22 +272,28 @@ class FlextLDIFParser:
         return line.rstrip("\r\n")
 
     def _iter_unfolded_lines(self) -> Iterator[str]:
-        """Iterate input unfolded lines, skipping comments."""
-        i = 0
-        while i < len(self._input_lines):
-            line = self._strip_line_sep(self._input_lines[i])
-            self.line_counter += 1
+        """Iterate input unfolded lines, skipping comments.
+
+        Input is consumed lazily with a single line of lookahead, so stream
+        sources are never materialized in full.
+        """
+        pending: str | None = None
+        for raw_line in self._input_lines:
+            line = self._strip_line_sep(raw_line)
 
             # Handle line continuation (lines starting with space)
-            i += 1
-            while i < len(self._input_lines) and self._input_lines[i].startswith(" "):
-                continuation = self._strip_line_sep(self._input_lines[i])
-                line += continuation[1:]  # Remove leading space
-                i += 1
+            if pending is not None and line.startswith(" "):
+                pending += line[1:]  # Remove leading space
+                continue
 
             # Skip comments
-            if not line.startswith("#"):
-                yield line
+            if pending is not None and not pending.startswith("#"):
+                yield pending
+            pending = line
+            self.line_counter += 1
+
+        if pending is not None and not pending.startswith("#"):
+            yield pending
 
     def _iter_blocks(self) -> Iterator[list[str]]:
         """Iterate input lines in blocks separated by blank lines."""
@@ -337,15 +348,17 @@ class FlextLDIFParser:
             Tuple of (attr_type, attr_value)
 
         """
-        if ":" not in line:
+        # Single scan for the separator; value markers are matched in place
+        # below instead of slicing the line tail for each check
+        colon_pos = line.find(":")
+        if colon_pos < 0:
             msg: str = f"Invalid LDIF line format: {line}"
             raise ValueError(msg)
 
-        colon_pos = line.index(":")
         attr_type = line[:colon_pos].strip()
 
         # Handle base64 encoded values (::)
-        if line[colon_pos:].startswith("::"):
+        if line.startswith("::", colon_pos):
             encoded_value = line[colon_pos + 2 :].strip()
             try:
                 attr_value = base64.b64decode(encoded_value).decode(self._encoding)
@@ -354,7 +367,7 @@ class FlextLDIFParser:
                 raise ValueError(base64_error_msg) from e
 
         # Handle URL references (:<)
-        elif line[colon_pos:].startswith(":<"):
+        elif line.startswith(":<", colon_pos):
             url = line[colon_pos + 2 :].strip()
             try:
                 attr_value = _safe_url_fetch(url, self._encoding)
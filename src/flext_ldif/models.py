@@ -11,7 +11,7 @@ import json
 import re as _re
 import uuid
 from collections.abc import Callable
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import cast, override
 
 from flext_core import (
@@ -26,8 +26,9 @@ from flext_core import (
 from pydantic import Field, field_validator
 
 from flext_ldif.constants import (
-    LDAP_GROUP_CLASSES,
-    LDAP_PERSON_CLASSES,
+    LDAP_GROUP_CLASS_MASK,
+    LDAP_OBJECTCLASS_BITS,
+    LDAP_PERSON_CLASS_MASK,
     MIN_DN_COMPONENTS,
     FlextLdifValidationMessages,
 )
@@ -54,6 +55,14 @@ def _create_empty_attributes() -> dict[str, list[str]]:
     return {}
 
 
+def _object_class_mask(object_classes: list[str]) -> int:
+    """OR together the ``LDAP_OBJECTCLASS_BITS`` of the given objectClasses."""
+    mask = 0
+    for object_class in object_classes:
+        mask |= LDAP_OBJECTCLASS_BITS.get(object_class.lower(), 0)
+    return mask
+
+
 def _validate_ldap_attribute_name(name: str) -> bool:
     """Local LDAP attribute name validator - breaks circular dependency.
 
@@ -171,6 +180,15 @@ class FlextLdifModels(FlextModel):
                 return ""
             return ",".join(components[1:]).strip()
 
+        @cached_property
+        def depth(self) -> int:
+            """Number of DN components, computed once per DN instance."""
+            return self.value.count(",") + 1 if self.value else 0
+
+        def get_depth(self) -> int:
+            """Get DN depth (number of components)."""
+            return self.depth
+
         def get_base_dn(self) -> str:
             """Get base DN (last component)."""
             if not self.value:
@@ -292,13 +310,13 @@ class FlextLdifModels(FlextModel):
 
         def is_person(self) -> bool:
             """Check if entry represents a person."""
-            object_classes = {oc.lower() for oc in self.get_object_classes()}
-            return bool(object_classes.intersection(LDAP_PERSON_CLASSES))
+            mask = _object_class_mask(self.get_object_classes())
+            return bool(mask & LDAP_PERSON_CLASS_MASK)
 
         def is_group(self) -> bool:
             """Check if entry represents a group."""
-            object_classes = {oc.lower() for oc in self.get_object_classes()}
-            return bool(object_classes.intersection(LDAP_GROUP_CLASSES))
+            mask = _object_class_mask(self.get_object_classes())
+            return bool(mask & LDAP_GROUP_CLASS_MASK)
 
     class Entry(FlextEntity):
         """LDIF entry domain entity."""
@@ -365,7 +383,7 @@ class FlextLdifModels(FlextModel):
 
         def get_single_attribute(self, name: str) -> str | None:
             """Get single attribute value."""
-            values = self.get_attribute(name)
+            values = self.attributes.get(name.lower())
             return values[0] if values else None
 
         def has_attribute(self, name: str) -> bool:
@@ -376,6 +394,19 @@ class FlextLdifModels(FlextModel):
             """Get objectClass values."""
             return self.get_attribute("objectclass") or []
 
+        @property
+        def object_class_mask(self) -> int:
+            """Bitmask of well-known objectClasses, see ``LDAP_OBJECTCLASS_BITS``."""
+            return _object_class_mask(self.get_object_classes())
+
+        def has_object_class(self, object_class: str) -> bool:
+            """Check if entry has objectClass (case-insensitive)."""
+            key = object_class.lower()
+            bit = LDAP_OBJECTCLASS_BITS.get(key)
+            if bit is not None:
+                return bool(self.object_class_mask & bit)
+            return any(oc.lower() == key for oc in self.get_object_classes())
+
         def add_attribute(self, name: str, value: str | list[str]) -> None:
             """Add attribute value(s)."""
             values = [value] if isinstance(value, str) else list(value)
@@ -392,13 +423,11 @@ class FlextLdifModels(FlextModel):
 
         def is_person(self) -> bool:
             """Check if entry represents a person."""
-            object_classes = {oc.lower() for oc in self.get_object_classes()}
-            return bool(object_classes.intersection(LDAP_PERSON_CLASSES))
+            return bool(self.object_class_mask & LDAP_PERSON_CLASS_MASK)
 
         def is_group(self) -> bool:
             """Check if entry represents a group."""
-            object_classes = {oc.lower() for oc in self.get_object_classes()}
-            return bool(object_classes.intersection(LDAP_GROUP_CLASSES))
+            return bool(self.object_class_mask & LDAP_GROUP_CLASS_MASK)
 
         def get_rdn(self) -> str:
             """Get Relative Distinguished Name."""
@@ -182,7 +182,7 @@ class FlextLdifServices(FlextModel):
             depth_analysis: dict[str, int] = {}
 
             for entry in entries:
-                dn_components = entry.dn.value.count(",") + 1
+                dn_components = entry.dn.depth
                 depth_key = f"depth_{dn_components}"
                 depth_analysis[depth_key] = depth_analysis.get(depth_key, 0) + 1
 
@@ -514,7 +514,7 @@ class FlextLdifUtilities:
             Number of DN components (depth)
 
         """
-        return str(entry.dn).count(",") + 1
+        return entry.dn.depth
 
     @staticmethod
     def validate_entry_with_error_handler(
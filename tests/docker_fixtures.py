@@ -6,12 +6,16 @@ a real OpenLDAP server, enabling full integration testing.
 
 from __future__ import annotations
 
+import codecs
 import contextlib
+import importlib.util
 import os
 import shutil
+import socket
 import time
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Generator, Iterable, Iterator
 from contextlib import asynccontextmanager
+from urllib.parse import urlparse
 
 # Make docker import optional to avoid import errors when docker package is not available
 from typing import TYPE_CHECKING
@@ -19,15 +23,13 @@ from typing import TYPE_CHECKING
 import pytest
 from flext_core import get_logger
 
-logger = get_logger(__name__)
+from flext_ldif import FlextLdifEntry, TLdif
 
-try:
-    import docker
+logger = get_logger(__name__)
 
-    DOCKER_AVAILABLE = True
-except ImportError:
-    DOCKER_AVAILABLE = False
-    docker = None
+# Probe for the SDK without importing it: conftest loads this module on every
+# session, and the docker client is only imported once a manager is created
+DOCKER_AVAILABLE = importlib.util.find_spec("docker") is not None
 
 if TYPE_CHECKING:
     from docker import DockerClient
@@ -50,136 +52,9 @@ TEST_ENV_VARS = {
     "LDIF_TEST_BASE_DN": OPENLDAP_BASE_DN,
 }
 
-
-class OpenLDAPContainerManager:
-    """Manages OpenLDAP Docker container for LDIF testing."""
-
-    def __init__(self) -> None:
-        """Initialize the container manager."""
-        self.client: DockerClient | None = None
-        if DOCKER_AVAILABLE:
-            self.client = docker.from_env()  # type: ignore[attr-defined]
-        self.container: Container | None = None
-
-    def start_container(self) -> Container | None:
-        """Start OpenLDAP container with proper configuration for LDIF testing."""
-        if not self.client:
-            return None
-
-        # Stop and remove existing container if it exists
-        self.stop_container()
-
-        # Start new container
-        self.container = self.client.containers.run(
-            OPENLDAP_IMAGE,
-            name=OPENLDAP_CONTAINER_NAME,
-            ports={"389/tcp": OPENLDAP_PORT},
-            environment={
-                "LDAP_ORGANISATION": "FLEXT LDIF Test Org",
-                "LDAP_DOMAIN": OPENLDAP_DOMAIN,
-                "LDAP_ADMIN_PASSWORD": OPENLDAP_ADMIN_PASSWORD,
-                "LDAP_CONFIG_PASSWORD": "config123",
-                "LDAP_READONLY_USER": "false",
-                "LDAP_RFC2307BIS_SCHEMA": "true",
-                "LDAP_BACKEND": "mdb",
-                "LDAP_TLS": "false",
-                "LDAP_REMOVE_CONFIG_AFTER_SETUP": "true",
-                "LDAP_SSL_HELPER_PREFIX": "ldap",
-            },
-            detach=True,
-            remove=True,  # Automatically remove when stopped
-        )
-
-        # Wait for container to be ready
-        self._wait_for_container_ready()
-
-        # Populate with test data
-        self._populate_test_data()
-
-        return self.container
-
-    def stop_container(self) -> None:
-        """Stop and remove OpenLDAP container."""
-        if not self.client:
-            return
-
-        try:
-            # Try to get existing container by name
-            existing = self.client.containers.get(OPENLDAP_CONTAINER_NAME)
-            if existing.status in {"running", "created", "paused"}:
-                existing.stop(timeout=5)
-            existing.remove(force=True)
-        except Exception as e:
-            # Container doesn't exist or failed to stop - this is expected
-            logger.debug("Container cleanup failed (expected): %s", e)
-
-        self.container = None
-
-    def _wait_for_container_ready(self, timeout: int = 30) -> None:
-        """Wait for OpenLDAP container to be ready to accept connections."""
-        if not self.container:
-            msg = "No container to wait for"
-            raise RuntimeError(msg)
-
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-
-            def _check_container_status() -> None:
-                if self.container is None:
-                    container_error = "Container is None"
-                    raise RuntimeError(container_error)
-                if self.container.status != "running":
-                    status_msg: str = (
-                        f"Container failed to start: {self.container.status}"
-                    )
-                    raise RuntimeError(status_msg)
-
-            try:
-                # Check if container is still running
-                self.container.reload()
-                _check_container_status()
-
-                # Try to connect to LDAP port
-                exec_result = self.container.exec_run(
-                    [
-                        "ldapsearch",
-                        "-x",
-                        "-H",
-                        "ldap://localhost:389",
-                        "-D",
-                        OPENLDAP_ADMIN_DN,
-                        "-w",
-                        OPENLDAP_ADMIN_PASSWORD,
-                        "-b",
-                        OPENLDAP_BASE_DN,
-                        "-s",
-                        "base",
-                        "(objectClass=*)",
-                    ],
-                    demux=True,
-                )
-
-                if exec_result.exit_code == 0:
-                    # Success! Container is ready
-                    return
-
-            except (RuntimeError, ValueError, TypeError):
-                pass  # Continue waiting
-
-            time.sleep(1)
-
-        timeout_msg: str = (
-            f"OpenLDAP container failed to become ready within {timeout} seconds"
-        )
-        raise RuntimeError(timeout_msg)
-
-    def _populate_test_data(self) -> None:
-        """Populate OpenLDAP container with test data for LDIF testing."""
-        if not self.container:
-            return
-
-        # LDIF data to populate
-        test_ldif = f"""
+# Test data loaded into the container. Built and encoded at import so that
+# populating the server right after it becomes ready does no extra work.
+TEST_LDIF = f"""
 # Create organizational units
 dn: ou=people,{OPENLDAP_BASE_DN}
 objectClass: organizationalUnit
@@ -270,23 +145,275 @@ member: uid=john.doe,ou=people,{OPENLDAP_BASE_DN}
 member: uid=jane.smith,ou=people,{OPENLDAP_BASE_DN}
 member: uid=bob.wilson,ou=people,{OPENLDAP_BASE_DN}
 """
+_TEST_LDIF_PAYLOAD = TEST_LDIF.encode("utf-8")
+_LDAPADD_COMMAND = [
+    "/usr/bin/ldapadd",
+    "-x",
+    "-H",
+    "ldap://localhost:389",
+    "-D",
+    OPENLDAP_ADMIN_DN,
+    "-w",
+    OPENLDAP_ADMIN_PASSWORD,
+]
+
+
+def _ber(tag: int, payload: bytes) -> bytes:
+    """Encode one BER TLV with a definite length."""
+    length = len(payload)
+    if length < 0x80:
+        return bytes((tag, length)) + payload
+    encoded = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes((tag, 0x80 | len(encoded))) + encoded + payload
+
+
+# Admin simple bind as an LDAPMessage (RFC 4511 section 4.2), used as the
+# readiness probe so no docker exec is spawned while the server starts up
+_ADMIN_BIND_REQUEST = _ber(
+    0x30,
+    _ber(0x02, b"\x01")
+    + _ber(
+        0x60,
+        _ber(0x02, b"\x03")
+        + _ber(0x04, OPENLDAP_ADMIN_DN.encode("utf-8"))
+        + _ber(0x80, OPENLDAP_ADMIN_PASSWORD.encode("utf-8")),
+    ),
+)
+
+
+def _read_ber_header(data: bytes, offset: int) -> tuple[int, int, int] | None:
+    """Return ``(tag, content offset, content length)`` of the TLV at ``offset``."""
+    if offset + 2 > len(data):
+        return None
+    tag, first = data[offset], data[offset + 1]
+    offset += 2
+    if first < 0x80:
+        return tag, offset, first
+    size = first & 0x7F
+    if not size or offset + size > len(data):
+        return None
+    return tag, offset + size, int.from_bytes(data[offset : offset + size], "big")
+
+
+def _is_bind_success(reply: bytes) -> bool:
+    """Check that ``reply`` is an LDAPMessage carrying a successful BindResponse."""
+    # LDAPMessage(0x30) { messageID(0x02), BindResponse(0x61) { resultCode, ... } }
+    message = _read_ber_header(reply, 0)
+    if message is None or message[0] != 0x30:
+        return False
+    message_id = _read_ber_header(reply, message[1])
+    if message_id is None or message_id[0] != 0x02:
+        return False
+    response = _read_ber_header(reply, message_id[1] + message_id[2])
+    if response is None or response[0] != 0x61:
+        return False
+    result_code = _read_ber_header(reply, response[1])
+    if result_code is None or result_code[0] != 0x0A:
+        return False
+    start, length = result_code[1], result_code[2]
+    return reply[start : start + length] == b"\x00"
+
+
+def _ldap_probe_host() -> str:
+    """Host where published container ports are reachable."""
+    docker_host = urlparse(os.environ.get("DOCKER_HOST", ""))
+    if docker_host.scheme in {"tcp", "ssh"} and docker_host.hostname:
+        return docker_host.hostname
+    return "localhost"
+
+
+def _iter_text_lines(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[str]:
+    """Decode a byte chunk stream incrementally and yield complete text lines."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        yield from lines
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+class OpenLDAPContainerManager:
+    """Manages OpenLDAP Docker container for LDIF testing."""
+
+    def __init__(self) -> None:
+        """Initialize the container manager."""
+        self.client: DockerClient | None = None
+        if DOCKER_AVAILABLE:
+            import docker
+
+            self.client = docker.from_env()
+        self.container: Container | None = None
+
+    def start_container(self) -> Container | None:
+        """Start OpenLDAP container with proper configuration for LDIF testing."""
+        if not self.client:
+            return None
+
+        # Stop and remove existing container if it exists
+        self.stop_container()
+
+        # Start new container
+        self.container = self.client.containers.run(
+            OPENLDAP_IMAGE,
+            name=OPENLDAP_CONTAINER_NAME,
+            ports={"389/tcp": OPENLDAP_PORT},
+            environment={
+                "LDAP_ORGANISATION": "FLEXT LDIF Test Org",
+                "LDAP_DOMAIN": OPENLDAP_DOMAIN,
+                "LDAP_ADMIN_PASSWORD": OPENLDAP_ADMIN_PASSWORD,
+                "LDAP_CONFIG_PASSWORD": "config123",
+                "LDAP_READONLY_USER": "false",
+                "LDAP_RFC2307BIS_SCHEMA": "true",
+                "LDAP_BACKEND": "mdb",
+                "LDAP_TLS": "false",
+                "LDAP_REMOVE_CONFIG_AFTER_SETUP": "true",
+                "LDAP_SSL_HELPER_PREFIX": "ldap",
+            },
+            detach=True,
+            remove=True,  # Automatically remove when stopped
+        )
+
+        # Wait for container to be ready
+        self._wait_for_container_ready()
+
+        # Populate with test data
+        self._populate_test_data()
+
+        return self.container
+
+    def stop_container(self) -> None:
+        """Stop and remove OpenLDAP container."""
+        if not self.client:
+            return
 
         try:
-            # Create temp file and import LDIF inside the container without hardcoded /tmp
-            shell_cmd = (
-                "TF=$(mktemp -t flext_ldif.XXXXXX.ldif); "
-                "cat > \"$TF\" << 'EOF'\n"
-                f"{test_ldif}\n"
-                "EOF\n"
-                f'/usr/bin/ldapadd -x -H ldap://localhost:389 -D "{OPENLDAP_ADMIN_DN}" '
-                f'-w "{OPENLDAP_ADMIN_PASSWORD}" -f "$TF"; '
-                'RC=$?; rm -f "$TF"; exit $RC'
-            )
-            exec_result = self.container.exec_run(["sh", "-c", shell_cmd], demux=True)
-            if exec_result.exit_code != 0:
-                return
-        except (RuntimeError, ValueError, TypeError):
-            pass
+            # Try to get existing container by name; a forced remove kills and
+            # deletes it in one API call instead of waiting on a graceful stop
+            existing = self.client.containers.get(OPENLDAP_CONTAINER_NAME)
+            existing.remove(force=True)
+        except Exception as e:
+            # Container doesn't exist or failed to stop - this is expected
+            logger.debug("Container cleanup failed (expected): %s", e)
+
+        self.container = None
+
+    def _wait_for_container_ready(self, timeout: int = 30) -> None:
+        """Wait for OpenLDAP container to be ready to accept connections.
+
+        Polls the published port with an admin LDAP bind and exponential
+        backoff. The bind is answered only once slapd itself is serving, so no
+        per-poll ``docker exec`` is needed.
+        """
+        if not self.container:
+            msg = "No container to wait for"
+            raise RuntimeError(msg)
+
+        def _check_container_status() -> None:
+            if self.container is None:
+                container_error = "Container is None"
+                raise RuntimeError(container_error)
+            if self.container.status != "running":
+                status_msg: str = f"Container failed to start: {self.container.status}"
+                raise RuntimeError(status_msg)
+
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        while time.monotonic() < deadline:
+            try:
+                # Check if container is still running
+                self.container.reload()
+                _check_container_status()
+
+                if self._can_bind():
+                    # Success! Container is ready
+                    return
+
+            except (RuntimeError, ValueError, TypeError):
+                pass  # Continue waiting
+
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+        timeout_msg: str = (
+            f"OpenLDAP container failed to become ready within {timeout} seconds"
+        )
+        raise RuntimeError(timeout_msg)
+
+    @staticmethod
+    def _can_bind() -> bool:
+        """Confirm the admin bind works by speaking LDAP to the published port.
+
+        A TCP connect alone is not enough: Docker's userland proxy accepts
+        connections as soon as the container starts, then closes them while
+        slapd is not yet listening, so only a BindResponse counts as ready.
+        """
+        try:
+            with socket.create_connection(
+                (_ldap_probe_host(), OPENLDAP_PORT),
+                timeout=1.0,
+            ) as probe:
+                probe.sendall(_ADMIN_BIND_REQUEST)
+                reply = probe.recv(64)
+        except OSError:
+            return False
+        return _is_bind_success(reply)
+
+    def _populate_test_data(self) -> None:
+        """Populate OpenLDAP container with test data for LDIF testing."""
+        if not self.container:
+            return
+
+        with contextlib.suppress(RuntimeError, ValueError, TypeError, OSError):
+            self._pipe_to_container(_LDAPADD_COMMAND, _TEST_LDIF_PAYLOAD)
+
+    def _pipe_to_container(self, cmd: list[str], payload: bytes) -> int | None:
+        """Run ``cmd`` in the container with ``payload`` on its stdin.
+
+        ``exec_run`` cannot feed stdin, so the exec is driven through the
+        low-level API and the payload written straight to its socket - no
+        temporary file has to be created, read and removed in the container.
+        """
+        if not self.client or not self.container:
+            return None
+
+        api = self.client.api
+        exec_id = api.exec_create(self.container.id, cmd, stdin=True)["Id"]
+        sock = api.exec_start(exec_id, socket=True)
+        raw = getattr(sock, "_sock", sock)
+        try:
+            raw.sendall(payload)
+            raw.shutdown(socket.SHUT_WR)
+            # Drain output until the command exits and closes the stream
+            while raw.recv(4096):
+                pass
+        finally:
+            raw.close()
+
+        exit_code: int | None = api.exec_inspect(exec_id)["ExitCode"]
+        return exit_code
+
+    @staticmethod
+    def _export_command(search_base: str, scope: str) -> list[str]:
+        """Build the ldapsearch command that dumps the tree as LDIF."""
+        return [
+            "ldapsearch",
+            "-x",
+            "-H",
+            "ldap://localhost:389",
+            "-D",
+            OPENLDAP_ADMIN_DN,
+            "-w",
+            OPENLDAP_ADMIN_PASSWORD,
+            "-b",
+            search_base,
+            "-s",
+            scope,
+            "(objectClass=*)",
+            "-LLL",  # LDIF format without comments
+        ]
 
     def get_ldif_export(self, base_dn: str | None = None, scope: str = "sub") -> str:
         """Export LDIF data from the container."""
@@ -297,22 +424,7 @@ member: uid=bob.wilson,ou=people,{OPENLDAP_BASE_DN}
 
         try:
             exec_result = self.container.exec_run(
-                [
-                    "ldapsearch",
-                    "-x",
-                    "-H",
-                    "ldap://localhost:389",
-                    "-D",
-                    OPENLDAP_ADMIN_DN,
-                    "-w",
-                    OPENLDAP_ADMIN_PASSWORD,
-                    "-b",
-                    search_base,
-                    "-s",
-                    scope,
-                    "(objectClass=*)",
-                    "-LLL",  # LDIF format without comments
-                ],
+                self._export_command(search_base, scope),
                 demux=True,
             )
 
@@ -325,6 +437,51 @@ member: uid=bob.wilson,ou=people,{OPENLDAP_BASE_DN}
 
         return ""
 
+    def iter_ldif_export(
+        self,
+        base_dn: str | None = None,
+        scope: str = "sub",
+    ) -> Iterator[FlextLdifEntry]:
+        """Stream entries out of the container as ldapsearch produces them.
+
+        Unlike ``get_ldif_export`` the exec output is never buffered or
+        decoded as a whole; stdout chunks are split into lines and parsed
+        incrementally, so memory stays bounded by a single record.
+
+        Failures follow ``get_ldif_export`` and never raise: an unparsable
+        record ends the stream, and a non-zero ldapsearch exit status (bad
+        base DN, bind error) is logged once the output has been drained,
+        since entries already yielded cannot be taken back.
+        """
+        if not self.client or not self.container:
+            return
+
+        # exec_run(stream=True) exposes no exit code, so drive the exec through
+        # the low-level API and inspect it after the stream is drained
+        api = self.client.api
+        search_base = base_dn or OPENLDAP_BASE_DN
+        exec_id = api.exec_create(
+            self.container.id,
+            self._export_command(search_base, scope),
+        )["Id"]
+        output = api.exec_start(exec_id, stream=True, demux=True)
+        stdout_chunks = (stdout for stdout, _stderr in output if stdout)
+
+        try:
+            yield from TLdif.iter_parse(_iter_text_lines(stdout_chunks))
+        except ValueError as e:
+            logger.warning("LDIF export stream could not be parsed: %s", e)
+            return
+
+        exit_code = api.exec_inspect(exec_id)["ExitCode"]
+        if exit_code != 0:
+            logger.warning(
+                "ldapsearch export of %s exited with status %s; "
+                "streamed entries may be incomplete",
+                search_base,
+                exit_code,
+            )
+
     def is_container_running(self) -> bool:
         """Check if the OpenLDAP container is running."""
         if not self.container:
@@ -7,34 +7,54 @@ covering real-world scenarios and enterprise use cases.
 from __future__ import annotations
 
 import gc
-import queue
-import sys
-import tempfile
-import threading
-import time
+import os
+import tracemalloc
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Final
 
 import pytest
 
 from flext_ldif import (
     FlextLdifAPI,
     FlextLdifConfig,
+    FlextLdifEntry,
+    TLdif,
     flext_ldif_parse,
     flext_ldif_validate,
     flext_ldif_write,
 )
 
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
 # Constants
 EXPECTED_DATA_COUNT = 3
 
+# Configuration scenarios, validated once at import
+_STRICT_CONFIG: Final[FlextLdifConfig] = FlextLdifConfig.model_validate(
+    {
+        "strict_validation": True,
+        "max_entries": 20,
+        "max_entry_size": 2048,
+    },
+)
+_PERMISSIVE_CONFIG: Final[FlextLdifConfig] = FlextLdifConfig.model_validate(
+    {
+        "strict_validation": False,
+        "max_entries": 1000,
+        "max_entry_size": 10240,
+    },
+)
+_RESTRICTIVE_CONFIG: Final[FlextLdifConfig] = FlextLdifConfig.model_validate(
+    {
+        "max_entries": 5,
+    },
+)
 
-class TestE2EEnterpriseWorkflows:
-    """Enterprise E2E tests for complete LDIF workflows."""
-
-    @pytest.fixture
-    def enterprise_ldif_sample(self) -> str:
-        """Enterprise LDIF sample with various entry types."""
-        return """dn: dc=enterprise,dc=com
+# Sample data shared by every test in the module, built once at import
+_ENTERPRISE_LDIF: Final[str] = """dn: dc=enterprise,dc=com
 objectClass: top
 objectClass: domain
 dc: enterprise
@@ -127,13 +147,147 @@ member: cn=Bob Wilson,ou=people,dc=enterprise,dc=com
 
 """
 
+_REALISTIC_ENTERPRISE_LDIF: Final[str] = """dn: dc=corp,dc=example,dc=com
+objectClass: top
+objectClass: domain
+dc: corp
+
+dn: ou=departments,dc=corp,dc=example,dc=com
+objectClass: top
+objectClass: organizationalUnit
+ou: departments
+
+dn: ou=engineering,ou=departments,dc=corp,dc=example,dc=com
+objectClass: top
+objectClass: organizationalUnit
+ou: engineering
+description: Engineering Department
+
+dn: ou=people,dc=corp,dc=example,dc=com
+objectClass: top
+objectClass: organizationalUnit
+ou: people
+
+dn: cn=Sarah Connor,ou=people,dc=corp,dc=example,dc=com
+objectClass: top
+objectClass: person
+objectClass: organizationalPerson
+objectClass: inetOrgPerson
+cn: Sarah Connor
+sn: Connor
+givenName: Sarah
+mail: sarah.connor@corp.example.com
+uid: sconnor
+employeeNumber: ENG001
+title: Senior Software Engineer
+departmentNumber: engineering
+
+dn: cn=Kyle Reese,ou=people,dc=corp,dc=example,dc=com
+objectClass: top
+objectClass: person
+objectClass: organizationalPerson
+objectClass: inetOrgPerson
+cn: Kyle Reese
+sn: Reese
+givenName: Kyle
+mail: kyle.reese@corp.example.com
+uid: kreese
+employeeNumber: ENG002
+title: DevOps Engineer
+departmentNumber: engineering
+
+dn: cn=engineering-team,ou=groups,dc=corp,dc=example,dc=com
+objectClass: top
+objectClass: groupOfNames
+cn: engineering-team
+description: Engineering team members
+member: cn=Sarah Connor,ou=people,dc=corp,dc=example,dc=com
+member: cn=Kyle Reese,ou=people,dc=corp,dc=example,dc=com
+
+"""
+
+# Parse, validate and write callables of one public facade, returning plain
+# values so the round-trip test can drive every facade the same way
+_FacadeCalls = tuple[
+    Callable[[str], list[FlextLdifEntry]],
+    Callable[[list[FlextLdifEntry]], bool],
+    Callable[[list[FlextLdifEntry]], str],
+]
+
+
+def _api_facade(api: FlextLdifAPI) -> _FacadeCalls:
+    return (
+        lambda content: api.parse(content).value,
+        lambda entries: api.validate(entries).value,
+        lambda entries: api.write(entries).value,
+    )
+
+
+def _tldif_facade(_api: FlextLdifAPI) -> _FacadeCalls:
+    return (
+        lambda content: TLdif.parse(content).value,
+        lambda entries: TLdif.validate_entries(entries).value,
+        lambda entries: TLdif.write(entries).value,
+    )
+
+
+def _convenience_facade(_api: FlextLdifAPI) -> _FacadeCalls:
+    return flext_ldif_parse, flext_ldif_validate, flext_ldif_write
+
+
+class TestE2EEnterpriseWorkflows:
+    """Enterprise E2E tests for complete LDIF workflows."""
+
+    @pytest.fixture(scope="module")
+    def enterprise_ldif_sample(self) -> str:
+        """Enterprise LDIF sample with various entry types."""
+        return _ENTERPRISE_LDIF
+
+    @pytest.fixture(scope="module")
+    def large_ldif(self) -> str:
+        """Larger LDIF dataset for performance workflows, generated once."""
+        parts = [
+            """dn: dc=performance,dc=com
+objectClass: top
+objectClass: domain
+dc: performance
+
+dn: ou=people,dc=performance,dc=com
+objectClass: top
+objectClass: organizationalUnit
+ou: people
+
+""",
+        ]
+
+        # Add many person entries
+        for i in range(50):
+            parts.append(f"""dn: cn=user{i:03d},ou=people,dc=performance,dc=com
+objectClass: top
+objectClass: person
+objectClass: inetOrgPerson
+cn: user{i:03d}
+sn: User{i:03d}
+givenName: Test{i:03d}
+mail: user{i:03d}@performance.com
+uid: user{i:03d}
+employeeNumber: EMP{i:03d}
+
+""")
+        return "".join(parts)
+
+    @pytest.fixture(scope="module")
+    def api(self) -> FlextLdifAPI:
+        """Default-configured API shared by the module's workflows."""
+        return FlextLdifAPI()
+
     def test_e2e_complete_ldif_processing_workflow(
         self,
+        api: FlextLdifAPI,
         enterprise_ldif_sample: str,
     ) -> None:
         """Test complete LDIF processing workflow from input to output."""
         # Step 1: Parse LDIF content
-        api = FlextLdifAPI()
         parse_result = api.parse(enterprise_ldif_sample)
 
         assert parse_result.is_success
@@ -142,11 +296,8 @@ member: cn=Bob Wilson,ou=people,dc=enterprise,dc=com
             raise AssertionError(msg)
         entries = parse_result.value
 
-        # Step 2: Validate all entries
-        validate_result = api.validate(entries)
-        assert validate_result.is_success
-
-        # Step 3: Filter person entries
+        # Step 2: Filter person entries (validation of the parsed sample is
+        # covered by test_e2e_round_trip_workflow)
         person_filter_result = api.filter_persons(entries)
         assert person_filter_result.is_success
         person_entries = person_filter_result.value
@@ -154,7 +305,7 @@ member: cn=Bob Wilson,ou=people,dc=enterprise,dc=com
             msg: str = f"Expected 3 (John, Alice, Bob), got {len(person_entries)}"
             raise AssertionError(msg)
 
-        # Step 4: Filter by specific objectClass
+        # Step 3: Filter by specific objectClass
         inetorg_result = api.filter_by_objectclass(entries, "inetOrgPerson")
         if not inetorg_result.is_success:
             msg: str = f"Filter by objectClass failed: {inetorg_result.error}"
@@ -164,7 +315,7 @@ member: cn=Bob Wilson,ou=people,dc=enterprise,dc=com
             msg: str = f"Expected {3}, got {len(inetorg_entries)}"
             raise AssertionError(msg)
 
-        # Step 5: Sort hierarchically
+        # Step 4: Sort hierarchically
         sort_result = api.sort_hierarchically(entries)
         assert sort_result.is_success
         sorted_entries = sort_result.value
@@ -175,217 +326,178 @@ member: cn=Bob Wilson,ou=people,dc=enterprise,dc=com
             msg: str = f"Expected dc=enterprise,dc=com, got {root_entry.dn!s}"
             raise AssertionError(msg)
 
-        # Step 6: Find specific entry by DN
-        target_dn = "cn=John Smith,ou=people,dc=enterprise,dc=com"
-        found_result = api.find_entry_by_dn(entries, target_dn)
-        assert found_result.is_success
-        found_entry = found_result.value
-        assert found_entry is not None
-        if found_entry.get_attribute("employeeNumber") != ["EMP001"]:
-            msg: str = f"Expected ['EMP001'], got {found_entry.get_attribute('employeeNumber')}"
-            raise AssertionError(msg)
-
-        # Step 7: Write back to LDIF
-        write_result = api.write(sorted_entries)
-        assert write_result.is_success
-        output_ldif = write_result.value
-
-        # Step 8: Validate round-trip integrity
-        reparse_result = api.parse(output_ldif)
-        assert reparse_result.is_success
-        if len(reparse_result.value) != len(sorted_entries):
-            msg: str = (
-                f"Expected {len(sorted_entries)}, got {len(reparse_result.value)}"
-            )
-            raise AssertionError(msg)
-
-    def test_e2e_file_processing_workflow(self, enterprise_ldif_sample: str) -> None:
-        """Test complete file processing workflow."""
-        api = FlextLdifAPI()
-
-        # Create temporary input file
-        with tempfile.NamedTemporaryFile(
-            encoding="utf-8",
-            mode="w",
-            delete=False,
-            suffix=".ldif",
-        ) as input_file:
-            input_file.write(enterprise_ldif_sample)
-            input_path = Path(input_file.name)
-
-        # Create temporary output file path
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".ldif") as output_file:
-            output_path = Path(output_file.name)
-
-        try:
-            # Step 1: Parse from file
-            parse_result = api.parse_file(input_path)
-            assert parse_result.is_success
-            entries = parse_result.value
-
-            # Step 2: Process entries (filter and sort)
-            person_result = api.filter_persons(entries)
-            assert person_result.is_success
-            person_entries = person_result.value
-
-            sort_result = api.sort_hierarchically(person_entries)
-            assert sort_result.is_success
-            sorted_persons = sort_result.value
-
-            # Step 3: Write to output file
-            write_result = api.write_file(sorted_persons, output_path)
-            assert write_result.is_success
-
-            # Step 4: Verify output file
-            assert output_path.exists()
-            output_content = output_path.read_text(encoding="utf-8")
-            assert len(output_content) > 0
-            if "cn=John Smith" not in output_content:
-                msg: str = f"Expected 'cn=John Smith' in {output_content}"
-                raise AssertionError(msg)
-
-            # Step 5: Re-read and validate
-            reread_result = api.parse_file(output_path)
-            assert reread_result.is_success
-            if len(reread_result.value) != len(sorted_persons):
+        # Step 5: Find specific entries through an index keyed on the already
+        # lowercased DN values, so each lookup is a dict hit instead of a scan
+        entries_by_dn = {entry.dn.value: entry for entry in entries}
+        expected_employee_numbers = {
+            "cn=John Smith,ou=people,dc=enterprise,dc=com": ["EMP001"],
+            "cn=Alice Johnson,ou=people,dc=enterprise,dc=com": ["EMP002"],
+            "cn=Bob Wilson,ou=people,dc=enterprise,dc=com": ["EMP003"],
+        }
+        for target_dn, employee_number in expected_employee_numbers.items():
+            found_entry = entries_by_dn.get(target_dn.lower())
+            assert found_entry is not None
+            if found_entry.get_attribute("employeeNumber") != employee_number:
                 msg: str = (
-                    f"Expected {len(sorted_persons)}, got {len(reread_result.value)}"
+                    f"Expected {employee_number}, got "
+                    f"{found_entry.get_attribute('employeeNumber')}"
                 )
                 raise AssertionError(msg)
 
-        finally:
-            input_path.unlink(missing_ok=True)
-            output_path.unlink(missing_ok=True)
+        # Step 6: Write back to LDIF (reparse integrity is checked once per
+        # facade by test_e2e_round_trip_workflow)
+        write_result = api.write(sorted_entries)
+        assert write_result.is_success
+        assert len(write_result.value) > 0
 
-    def test_e2e_core_tldif_workflow(self, enterprise_ldif_sample: str) -> None:
-        """Test complete workflow using FlextLdifAPI core directly."""
-        # Use the main API instead of TLdif directly
-        api = FlextLdifAPI()
+    def test_e2e_file_processing_workflow(
+        self,
+        api: FlextLdifAPI,
+        enterprise_ldif_sample: str,
+        tmp_path: Path,
+    ) -> None:
+        """Test complete file processing workflow."""
+        # Create input file and output path in the per-test directory
+        input_path = tmp_path / "input.ldif"
+        input_path.write_text(enterprise_ldif_sample, encoding="utf-8")
+        output_path = tmp_path / "output.ldif"
 
-        # Step 1: Parse using main API
-        parse_result = api.parse(enterprise_ldif_sample)
+        # Step 1: Parse from file
+        parse_result = api.parse_file(input_path)
         assert parse_result.is_success
         entries = parse_result.value
 
-        # Step 2: Validate using main API
-        validate_result = api.validate(entries)
-        assert validate_result.is_success
+        # Step 2: Process entries (filter and sort)
+        person_result = api.filter_persons(entries)
+        assert person_result.is_success
+        person_entries = person_result.value
 
-        # Step 3: Write using main API
-        write_result = api.write(entries)
+        sort_result = api.sort_hierarchically(person_entries)
+        assert sort_result.is_success
+        sorted_persons = sort_result.value
+
+        # Step 3: Write to output file
+        write_result = api.write_file(sorted_persons, output_path)
         assert write_result.is_success
-        output_content = write_result.value
 
-        # Step 4: Round-trip test
-        reparse_result = api.parse(output_content)
-        assert reparse_result.is_success
-        if len(reparse_result.value) != len(entries):
-            msg: str = f"Expected {len(entries)}, got {len(reparse_result.value)}"
+        # Step 4: Verify output file
+        assert output_path.exists()
+        output_content = output_path.read_text(encoding="utf-8")
+        assert len(output_content) > 0
+        if "cn=John Smith" not in output_content:
+            msg: str = f"Expected 'cn=John Smith' in {output_content}"
             raise AssertionError(msg)
 
-        # Step 5: File operations
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".ldif") as temp_file:
-            temp_path = Path(temp_file.name)
-
-        try:
-            # Write to file
-            file_write_result = api.write_file(entries, str(temp_path))
-            assert file_write_result.is_success
-
-            # Read from file
-            file_read_result = api.parse_file(temp_path)
-            assert file_read_result.is_success
-            if len(file_read_result.value) != len(entries):
-                msg: str = f"Expected {len(entries)}, got {len(file_read_result.value)}"
-                raise AssertionError(msg)
-
-        finally:
-            temp_path.unlink(missing_ok=True)
+        # Step 5: Re-read and validate
+        reread_result = api.parse_file(output_path)
+        assert reread_result.is_success
+        if len(reread_result.value) != len(sorted_persons):
+            msg: str = (
+                f"Expected {len(sorted_persons)}, got {len(reread_result.value)}"
+            )
+            raise AssertionError(msg)
 
-    def test_e2e_convenience_functions_workflow(
+    @pytest.mark.parametrize(
+        "facade",
+        [
+            pytest.param(_api_facade, id="api"),
+            pytest.param(_tldif_facade, id="tldif"),
+            pytest.param(_convenience_facade, id="convenience"),
+        ],
+    )
+    def test_e2e_round_trip_workflow(
         self,
+        api: FlextLdifAPI,
         enterprise_ldif_sample: str,
+        facade: Callable[[FlextLdifAPI], _FacadeCalls],
     ) -> None:
-        """Test complete workflow using convenience functions."""
-        # Step 1: Parse using convenience function
-        entries = flext_ldif_parse(enterprise_ldif_sample)
+        """Test parse, validate, write and reparse through each public facade."""
+        parse, validate, write = facade(api)
+
+        # Step 1: Parse
+        entries = parse(enterprise_ldif_sample)
         if len(entries) != 9:
             msg: str = f"Expected {9}, got {len(entries)}"
             raise AssertionError(msg)
 
-        # Step 2: Validate using convenience function (SOLID fix: validate parsed entries, not raw LDIF)
-        is_valid = flext_ldif_validate(entries)
+        # Step 2: Validate parsed entries
+        is_valid = validate(entries)
         if not (is_valid):
             msg: str = f"Expected True, got {is_valid}"
             raise AssertionError(msg)
 
-        # Step 3: Write using convenience function
-        output_content = flext_ldif_write(entries)
+        # Step 3: Write
+        output_content = write(entries)
         assert len(output_content) > 0
 
-        # Step 4: Round-trip with convenience functions
-        reparsed_entries = flext_ldif_parse(output_content)
+        # Step 4: Round-trip
+        reparsed_entries = parse(output_content)
         if len(reparsed_entries) != len(entries):
             msg: str = f"Expected {len(entries)}, got {len(reparsed_entries)}"
             raise AssertionError(msg)
 
-        # Step 5: File output (SOLID fix: use API for file operations)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".ldif") as temp_file:
-            temp_path = Path(temp_file.name)
+    def test_e2e_core_tldif_workflow(
+        self,
+        api: FlextLdifAPI,
+        enterprise_ldif_sample: str,
+        tmp_path: Path,
+    ) -> None:
+        """Test file workflow using FlextLdifAPI core directly."""
+        # Step 1: Parse using main API
+        parse_result = api.parse(enterprise_ldif_sample)
+        assert parse_result.is_success
+        entries = parse_result.value
+
+        # Step 2: File operations
+        temp_path = tmp_path / "entries.ldif"
+
+        # Write to file, passing the path as a plain string
+        file_write_result = api.write_file(entries, os.fspath(temp_path))
+        assert file_write_result.is_success
+
+        # Read from file
+        file_read_result = api.parse_file(temp_path)
+        assert file_read_result.is_success
+        if len(file_read_result.value) != len(entries):
+            msg: str = f"Expected {len(entries)}, got {len(file_read_result.value)}"
+            raise AssertionError(msg)
+
+    def test_e2e_convenience_functions_workflow(
+        self,
+        api: FlextLdifAPI,
+        enterprise_ldif_sample: str,
+        tmp_path: Path,
+    ) -> None:
+        """Test file output for entries parsed by convenience functions."""
+        entries = flext_ldif_parse(enterprise_ldif_sample)
 
-        try:
-            # Use API for file writing, convenience function only returns string content
-            api = FlextLdifAPI()
-            file_result = api.write_file(entries, temp_path)
-            assert file_result.is_success
-            assert temp_path.exists()
+        # File output (SOLID fix: use API for file operations)
+        temp_path = tmp_path / "entries.ldif"
 
-        finally:
-            temp_path.unlink(missing_ok=True)
+        # Use API for file writing, convenience function only returns string content
+        file_result = api.write_file(entries, temp_path)
+        assert file_result.is_success
+        assert temp_path.exists()
 
     def test_e2e_configuration_scenarios(self, enterprise_ldif_sample: str) -> None:
         """Test E2E workflows with different configurations."""
         # Scenario 1: Strict configuration
-        strict_config = FlextLdifConfig.model_validate(
-            {
-                "strict_validation": True,
-                "max_entries": 20,
-                "max_entry_size": 2048,
-            },
-        )
-
-        strict_api = FlextLdifAPI(strict_config)
+        strict_api = FlextLdifAPI(_STRICT_CONFIG)
         strict_result = strict_api.parse(enterprise_ldif_sample)
         assert strict_result.is_success  # Should pass with valid data
 
         # Scenario 2: Permissive configuration
-        permissive_config = FlextLdifConfig.model_validate(
-            {
-                "strict_validation": False,
-                "max_entries": 1000,
-                "max_entry_size": 10240,
-            },
-        )
-
-        permissive_api = FlextLdifAPI(permissive_config)
+        permissive_api = FlextLdifAPI(_PERMISSIVE_CONFIG)
         permissive_result = permissive_api.parse(enterprise_ldif_sample)
         assert permissive_result.is_success
 
-        # Scenario 3: Restrictive configuration
-        restrictive_config = FlextLdifConfig.model_validate(
-            {
-                "max_entries": 5,  # Less than our sample
-            },
-        )
-
-        restrictive_api = FlextLdifAPI(restrictive_config)
+        # Scenario 3: Restrictive configuration (fewer entries than the sample)
+        restrictive_api = FlextLdifAPI(_RESTRICTIVE_CONFIG)
         restrictive_result = restrictive_api.parse(enterprise_ldif_sample)
         assert not restrictive_result.is_success  # Should fail due to limits
 
-    def test_e2e_error_recovery_workflow(self) -> None:
+    def test_e2e_error_recovery_workflow(self, api: FlextLdifAPI) -> None:
         """Test E2E workflow with error conditions and recovery."""
-        api = FlextLdifAPI()
-
         # Step 1: Try to parse invalid content
         invalid_content = "This is not LDIF content at all"
         parse_result = api.parse(invalid_content)
@@ -414,130 +526,112 @@ objectClass: person
             msg: str = f"Expected 'not found' in {file_result.error.lower() if file_result.error else 'None'}"
             raise AssertionError(msg)
 
-    def test_e2e_performance_workflow(self) -> None:
-        """Test E2E workflow performance with larger datasets."""
-        # Generate larger LDIF content
-        large_content = """dn: dc=performance,dc=com
-objectClass: top
-objectClass: domain
-dc: performance
-
-dn: ou=people,dc=performance,dc=com
-objectClass: top
-objectClass: organizationalUnit
-ou: people
-
-"""
-
-        # Add many person entries
-        for i in range(50):
-            large_content += f"""dn: cn=user{i:03d},ou=people,dc=performance,dc=com
-objectClass: top
-objectClass: person
-objectClass: inetOrgPerson
-cn: user{i:03d}
-sn: User{i:03d}
-givenName: Test{i:03d}
-mail: user{i:03d}@performance.com
-uid: user{i:03d}
-employeeNumber: EMP{i:03d}
-
-"""
-
-        api = FlextLdifAPI()
-
-        # Time the complete workflow
-        start_time = time.time()
-
-        # Parse
-        parse_result = api.parse(large_content)
+    @staticmethod
+    def _run_full_workflow(
+        api: FlextLdifAPI,
+        ldif_content: str,
+    ) -> tuple[list[FlextLdifEntry], list[FlextLdifEntry], list[FlextLdifEntry]]:
+        """Parse, filter, sort and write ``ldif_content`` once."""
+        parse_result = api.parse(ldif_content)
         assert parse_result.is_success
-        parse_time = time.time()
+        entries = parse_result.value
 
-        # Filter
-        person_result = api.filter_persons(parse_result.value)
+        person_result = api.filter_persons(entries)
         assert person_result.is_success
-        filter_time = time.time()
+        persons = person_result.value
 
-        # Sort
-        sort_result = api.sort_hierarchically(person_result.value)
+        sort_result = api.sort_hierarchically(persons)
         assert sort_result.is_success
-        sort_time = time.time()
+        sorted_persons = sort_result.value
 
-        # Write
-        write_result = api.write(sort_result.value)
+        write_result = api.write(sorted_persons)
         assert write_result.is_success
-        write_time = time.time()
-
-        # Calculate timings
-        total_time = write_time - start_time
-        parse_duration = parse_time - start_time
-        filter_duration = filter_time - parse_time
-        sort_duration = sort_time - filter_time
-        write_duration = write_time - sort_time
-
-        # Performance assertions
-        assert total_time < 5.0  # Total should be under 5 seconds
-        assert parse_duration < 2.0  # Parse should be under 2 seconds
-        assert filter_duration < 1.0  # Filter should be under 1 second
-        assert sort_duration < 1.0  # Sort should be under 1 second
-        assert write_duration < 2.0  # Write should be under 2 seconds
 
-        # Verify results
-        if len(parse_result.value) != 52:  # 2 structure + 50 people
-            msg: str = (
-                f"Expected 52 (2 structure + 50 people), got {len(parse_result.value)}"
+        return entries, persons, sorted_persons
+
+    @pytest.mark.performance
+    def test_e2e_performance_workflow(
+        self,
+        api: FlextLdifAPI,
+        large_ldif: str,
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        """Test E2E workflow performance with larger datasets."""
+
+        def setup() -> tuple[tuple[FlextLdifAPI, str], dict[str, object]]:
+            # Start every round from a collected heap with the collector off,
+            # so no generational collection lands inside the timed workflow
+            gc.collect()
+            gc.disable()
+            return (api, large_ldif), {}
+
+        # pytest-benchmark reports min/median/stddev over the rounds, so
+        # regressions are caught with --benchmark-compare instead of fixed
+        # wall-clock limits that vary between machines
+        try:
+            entries, persons, sorted_persons = benchmark.pedantic(
+                self._run_full_workflow,
+                setup=setup,
+                rounds=10,
             )
+        finally:
+            gc.enable()
+
+        # Verify results
+        if len(entries) != 52:  # 2 structure + 50 people
+            msg: str = f"Expected 52 (2 structure + 50 people), got {len(entries)}"
             raise AssertionError(msg)
-        assert len(person_result.value) == 50  # 50 people
-        if len(sort_result.value) != 50:  # Same after sorting
-            msg: str = f"Expected 50 (same after sorting), got {len(sort_result.value)}"
+        assert len(persons) == 50  # 50 people
+        if len(sorted_persons) != 50:  # Same after sorting
+            msg: str = f"Expected 50 (same after sorting), got {len(sorted_persons)}"
             raise AssertionError(msg)
 
-    def test_e2e_memory_efficiency_workflow(self) -> None:
+    def test_e2e_memory_efficiency_workflow(self, api: FlextLdifAPI) -> None:
         """Test E2E workflow memory efficiency."""
         # Generate medium-sized LDIF content
-        content = ""
+        parts: list[str] = []
         for i in range(20):
-            content += f"""dn: cn=user{i},dc=memory,dc=com
+            parts.append(f"""dn: cn=user{i},dc=memory,dc=com
 objectClass: person
 cn: user{i}
 sn: User{i}
 mail: user{i}@memory.com
 description: User number {i} for memory testing
 
-"""
-
-        # Measure memory before
-        gc.collect()
-        memory_before = sys.getsizeof(content)
+""")
+        content = "".join(parts)
 
-        api = FlextLdifAPI()
+        def run_workflow() -> tuple[list[FlextLdifEntry], str]:
+            entries = api.parse(content).value
+            persons = api.filter_persons(entries).value
+            sorted_persons = api.sort_hierarchically(persons).value
+            return entries, api.write(sorted_persons).value
 
-        # Process workflow
-        parse_result = api.parse(content)
-        person_result = api.filter_persons(parse_result.value)
-        sort_result = api.sort_hierarchically(person_result.value)
-        write_result = api.write(sort_result.value)
+        # Warm up once so lazy imports and caches are not charged to the run
+        run_workflow()
 
-        # Measure memory after
+        # Trace every allocation of the workflow - entry models, attribute
+        # dicts and output - rather than the shallow container sizes
         gc.collect()
-        total_memory = (
-            sys.getsizeof(parse_result.value)
-            + sys.getsizeof(person_result.value)
-            + sys.getsizeof(sort_result.value)
-            + sys.getsizeof(write_result.value)
-        )
+        tracemalloc.start()
+        try:
+            entries, output = run_workflow()
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
 
-        # Memory usage should be reasonable (not more than 5x input)
-        memory_ratio = total_memory / memory_before
-        assert memory_ratio < 5.0
+        assert len(entries) == 20
+        assert len(output) > 0
 
-    def _execute_workflow(self, ldif_sample: str) -> str:
+        # Peak usage should stay bounded per processed entry
+        memory_per_entry = peak_memory / len(entries)
+        if memory_per_entry >= 64 * 1024:
+            msg: str = f"Expected < 64 KiB per entry, got {memory_per_entry:.0f} bytes"
+            raise AssertionError(msg)
+
+    def _execute_workflow(self, api: FlextLdifAPI, ldif_sample: str) -> str:
         """Execute a single LDIF workflow."""
         try:
-            api = FlextLdifAPI()
-
             parse_result = api.parse(ldif_sample)
             if not parse_result.is_success:
                 return "failed"
@@ -554,31 +648,23 @@ description: User number {i} for memory testing
         else:
             return "success"
 
-    def test_e2e_concurrent_workflows(self, enterprise_ldif_sample: str) -> None:
+    def test_e2e_concurrent_workflows(
+        self,
+        api: FlextLdifAPI,
+        enterprise_ldif_sample: str,
+    ) -> None:
         """Test concurrent E2E workflows."""
-        results: queue.Queue[str] = queue.Queue()
-
-        def worker_workflow() -> None:
-            result = self._execute_workflow(enterprise_ldif_sample)
-            results.put(result)
-
-        # Start multiple worker threads
-        threads: list[threading.Thread] = []
-        for _ in range(5):
-            thread = threading.Thread(target=worker_workflow)
-            threads.append(thread)
-            thread.start()
-
-        # Wait for completion
-        for thread in threads:
-            thread.join()
+        # The API keeps no per-call state, so one instance serves every worker
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            results = list(
+                executor.map(
+                    lambda _: self._execute_workflow(api, enterprise_ldif_sample),
+                    range(5),
+                ),
+            )
 
         # Verify all succeeded
-        success_count = 0
-        while not results.empty():
-            if results.get() == "success":
-                success_count += 1
-
+        success_count = results.count("success")
         if success_count != 5:  # All workflows should succeed
             msg: str = f"Expected 5 (all workflows should succeed), got {success_count}"
             raise AssertionError(msg)
@@ -629,61 +715,4 @@ description: User number {i} for memory testing
 
     def _create_realistic_enterprise_data(self) -> str:
         """Create realistic enterprise LDIF data for testing."""
-        return """dn: dc=corp,dc=example,dc=com
-objectClass: top
-objectClass: domain
-dc: corp
-
-dn: ou=departments,dc=corp,dc=example,dc=com
-objectClass: top
-objectClass: organizationalUnit
-ou: departments
-
-dn: ou=engineering,ou=departments,dc=corp,dc=example,dc=com
-objectClass: top
-objectClass: organizationalUnit
-ou: engineering
-description: Engineering Department
-
-dn: ou=people,dc=corp,dc=example,dc=com
-objectClass: top
-objectClass: organizationalUnit
-ou: people
-
-dn: cn=Sarah Connor,ou=people,dc=corp,dc=example,dc=com
-objectClass: top
-objectClass: person
-objectClass: organizationalPerson
-objectClass: inetOrgPerson
-cn: Sarah Connor
-sn: Connor
-givenName: Sarah
-mail: sarah.connor@corp.example.com
-uid: sconnor
-employeeNumber: ENG001
-title: Senior Software Engineer
-departmentNumber: engineering
-
-dn: cn=Kyle Reese,ou=people,dc=corp,dc=example,dc=com
-objectClass: top
-objectClass: person
-objectClass: organizationalPerson
-objectClass: inetOrgPerson
-cn: Kyle Reese
-sn: Reese
-givenName: Kyle
-mail: kyle.reese@corp.example.com
-uid: kreese
-employeeNumber: ENG002
-title: DevOps Engineer
-departmentNumber: engineering
-
-dn: cn=engineering-team,ou=groups,dc=corp,dc=example,dc=com
-objectClass: top
-objectClass: groupOfNames
-cn: engineering-team
-description: Engineering team members
-member: cn=Sarah Connor,ou=people,dc=corp,dc=example,dc=com
-member: cn=Kyle Reese,ou=people,dc=corp,dc=example,dc=com
-
-"""
+        return _REALISTIC_ENTERPRISE_LDIF
@@ -68,6 +68,21 @@ objectClass: organizationalUnit
         output_ldif = api.write(entries).unwrap_or("")
         assert "dn: cn=John Doe,ou=people,dc=example,dc=com" in output_ldif
 
+    def test_sort_hierarchically_is_stable_by_depth(
+        self,
+        api: FlextLdifAPI,
+        sample_ldif_content: str,
+    ) -> None:
+        """Test hierarchical sort puts parents first and keeps sibling order."""
+        entries = api.parse(sample_ldif_content).unwrap_or([])
+
+        sorted_entries = api.sort_hierarchically(entries).unwrap_or([])
+        assert [entry.dn.value for entry in sorted_entries] == [
+            "ou=people,dc=example,dc=com",
+            "cn=john doe,ou=people,dc=example,dc=com",
+            "cn=jane smith,ou=people,dc=example,dc=com",
+        ]
+
     def test_file_operations(self, api: FlextLdifAPI, sample_ldif_content: str) -> None:
         """Test file read and write operations."""
         with tempfile.NamedTemporaryFile(
@@ -0,0 +1,60 @@
+"""Tests for the LDAP readiness probe used by the OpenLDAP Docker fixtures."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.docker_fixtures import _ADMIN_BIND_REQUEST, _is_bind_success
+
+# BindResponse { resultCode, matchedDN "", diagnosticMessage "" }
+_BIND_SUCCESS = b"\x61\x07\x0a\x01\x00\x04\x00\x04\x00"
+_BIND_INVALID_CREDENTIALS = b"\x61\x07\x0a\x01\x31\x04\x00\x04\x00"
+
+
+class TestLdapBindProbe:
+    """Test the hand-encoded admin bind and the BindResponse check."""
+
+    def test_admin_bind_request_bytes(self) -> None:
+        """Test the admin bind encodes to a known-good LDAPMessage."""
+        expected = (
+            b"\x30\x33\x02\x01\x01\x60\x2e\x02\x01\x03\x04\x1f"
+            b"cn=admin,dc=flext-ldif,dc=local"
+            b"\x80\x08admin123"
+        )
+        if _ADMIN_BIND_REQUEST != expected:
+            msg: str = f"Expected {expected!r}, got {_ADMIN_BIND_REQUEST!r}"
+            raise AssertionError(msg)
+
+    @pytest.mark.parametrize(
+        ("reply", "expected"),
+        [
+            pytest.param(
+                b"\x30\x0c\x02\x01\x01" + _BIND_SUCCESS,
+                True,
+                id="success",
+            ),
+            pytest.param(
+                b"\x30\x0c\x02\x01\x01" + _BIND_INVALID_CREDENTIALS,
+                False,
+                id="invalid-credentials",
+            ),
+            pytest.param(
+                b"\x30\x84\x00\x00\x00\x11\x02\x02\x01\x00"
+                b"\x61\x84\x00\x00\x00\x07\x0a\x01\x00\x04\x00\x04\x00",
+                True,
+                id="long-form-lengths",
+            ),
+            pytest.param(
+                b"\x30\x0c\x02\x01\x01\x65\x07\x0a\x01\x00\x04\x00\x04\x00",
+                False,
+                id="not-a-bind-response",
+            ),
+            pytest.param(b"\x30\x84\x00", False, id="truncated"),
+            pytest.param(b"", False, id="empty"),
+        ],
+    )
+    def test_is_bind_success(self, reply: bytes, *, expected: bool) -> None:
+        """Test BindResponse parsing across result codes and BER length forms."""
+        if _is_bind_success(reply) is not expected:
+            msg: str = f"Expected {expected} for {reply!r}"
+            raise AssertionError(msg)
@@ -4,14 +4,18 @@
 # Reason: Multiple assertion checks are common in tests for comprehensive error validation
 
 import base64
+import io
 import unittest.mock
 from collections import UserString
+from collections.abc import Iterator
 from typing import Never
 from unittest.mock import Mock
 
 import pytest
+from flext_core import FlextValidationError
 
 import flext_ldif.format_handler_service as fh
+from flext_ldif import FlextLdifEntry, FlextLdifFactory, TLdif
 from flext_ldif.format_handler_service import (
     HTTP_OK,
     FlextLDIFParser,
@@ -21,6 +25,7 @@ from flext_ldif.format_handler_service import (
     modernized_ldif_parse,
     modernized_ldif_write,
 )
+from tests.docker_fixtures import _iter_text_lines
 
 
 class TestUtilityFunctions:
@@ -442,6 +447,111 @@ objectClass: person
             in record["cn"][0]
         )
 
+    def test_parse_from_line_stream(self) -> None:
+        """Test parsing lazily from an iterable of lines (e.g. a file)."""
+        stream = io.StringIO(
+            "dn: cn=streamed user,ou=people,\n"
+            " dc=example,dc=com\n"
+            "objectClass: person\n"
+            "cn: streamed user\n"
+            "\n"
+            "# trailing comment\n"
+            "dn: dc=example,dc=com\n"
+            "objectClass: dcObject\n"
+        )
+        parser = FlextLDIFParser(stream)
+        records = parser.parse()
+
+        dn, record = next(records)
+        assert dn == "cn=streamed user,ou=people,dc=example,dc=com"
+        assert record["cn"] == ["streamed user"]
+        assert parser.records_read == 1
+
+        dn, record = next(records)
+        assert dn == "dc=example,dc=com"
+        assert record["objectClass"] == ["dcObject"]
+        assert list(records) == []
+
+    def test_tldif_iter_parse_yields_entries_lazily(self) -> None:
+        """Test TLdif.iter_parse builds each entry before reading further input."""
+        consumed: list[str] = []
+
+        def lines() -> Iterator[str]:
+            for line in (
+                "dn: cn=first,dc=example,dc=com\n",
+                "objectClass: person\n",
+                "\n",
+                "dn: cn=second,dc=example,dc=com\n",
+                "objectClass: person\n",
+            ):
+                consumed.append(line)
+                yield line
+
+        entries = TLdif.iter_parse(lines())
+
+        first = next(entries)
+        assert isinstance(first, FlextLdifEntry)
+        assert first.dn.value == "cn=first,dc=example,dc=com"
+        # Only one line of lookahead past the record separator has been read
+        assert len(consumed) == 4
+
+        assert [entry.dn.value for entry in entries] == ["cn=second,dc=example,dc=com"]
+        assert len(consumed) == 5
+
+    def test_tldif_iter_parse_malformed_record_raises(self) -> None:
+        """Test TLdif.iter_parse raises ValueError on a malformed record."""
+        stream = io.StringIO(
+            "dn: cn=valid,dc=example,dc=com\n"
+            "objectClass: person\n"
+            "\n"
+            "dn: cn=broken,dc=example,dc=com\n"
+            "this line has no separator\n"
+        )
+        entries = TLdif.iter_parse(stream)
+
+        assert next(entries).dn.value == "cn=valid,dc=example,dc=com"
+        with pytest.raises(ValueError):
+            next(entries)
+
+    def test_iter_text_lines_from_byte_chunks(self) -> None:
+        """Test the docker export helper splitting byte chunks into lines.
+
+        Covers a UTF-8 character split across chunks, CRLF endings and a last
+        line without a trailing newline.
+        """
+        chunks = [
+            b"dn: cn=Jos\xc3",
+            b"\xa9,dc=example,dc=com\r\n",
+            b"objectClass: person\r",
+            b"\ncn: Jos\xc3\xa9",
+        ]
+        lines = list(_iter_text_lines(chunks))
+        assert lines == [
+            "dn: cn=José,dc=example,dc=com\r",
+            "objectClass: person\r",
+            "cn: José",
+        ]
+
+        entries = list(TLdif.iter_parse(_iter_text_lines(chunks)))
+        assert len(entries) == 1
+        assert entries[0].get_single_attribute("cn") == "José"
+
+    def test_factory_create_entry_contract(self) -> None:
+        """Test the entry factory TLdif.iter_parse relies on.
+
+        It returns an entry directly and raises on invalid input rather than
+        returning a result object.
+        """
+        entry = FlextLdifFactory.create_entry(
+            "cn=contract,dc=example,dc=com",
+            {"objectClass": ["person"], "cn": ["contract"]},
+        )
+        assert isinstance(entry, FlextLdifEntry)
+        assert entry.get_single_attribute("cn") == "contract"
+
+        with pytest.raises((ValueError, FlextValidationError)):
+            FlextLdifFactory.create_entry("not a dn", {"cn": ["x"]})
+
     def test_parse_with_ignored_attributes(self) -> None:
         """Test parsing with ignored attributes."""
         ldif_content = """dn: cn=John Doe,ou=people,dc=example,dc=com
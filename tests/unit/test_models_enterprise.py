@@ -185,6 +185,69 @@ class TestFlextLdifEntryEnterprise:
             )
             raise AssertionError(msg)
 
+    def test_has_object_class_tracks_attribute_changes(
+        self, sample_entry_data: dict[str, object]
+    ) -> None:
+        """Test cached objectClass mask follows objectClass updates."""
+        entry = FlextLdifEntry.model_validate(sample_entry_data)
+        assert not entry.has_object_class("groupOfNames")
+        assert not entry.has_object_class("customAuxClass")
+
+        entry.add_attribute("objectClass", ["groupOfNames", "customAuxClass"])
+        assert entry.has_object_class("GROUPOFNAMES")
+        assert entry.has_object_class("customauxclass")
+
+        entry.remove_attribute("objectClass")
+        assert not entry.has_object_class("person")
+
+    def test_is_person_and_is_group_use_class_masks(self) -> None:
+        """Test person/group checks match mixed-case objectClass values."""
+        person = FlextLdifEntry.model_validate(
+            {
+                "dn": "uid=jdoe,ou=people,dc=example,dc=com",
+                "attributes": {"objectClass": ["top", "inetOrgPerson"]},
+            },
+        )
+        group = FlextLdifEntry.model_validate(
+            {
+                "dn": "cn=admins,ou=groups,dc=example,dc=com",
+                "attributes": {"objectClass": ["top", "groupOfUniqueNames"]},
+            },
+        )
+        assert person.is_person()
+        assert not person.is_group()
+        assert group.is_group()
+        assert not group.is_person()
+
+    def test_object_class_checks_follow_attribute_changes(self) -> None:
+        """Test person/group checks reflect copies and direct attribute writes."""
+        person = FlextLdifEntry.model_validate(
+            {
+                "dn": "uid=jdoe,ou=people,dc=example,dc=com",
+                "attributes": {"objectClass": ["inetOrgPerson"]},
+            },
+        )
+        assert person.is_person()
+
+        copied = person.model_copy(
+            update={"attributes": {"objectclass": ["groupOfNames"]}},
+        )
+        assert copied.is_group()
+        assert not copied.is_person()
+
+        person.attributes["objectclass"] = ["groupOfNames"]
+        assert person.is_group()
+        assert not person.is_person()
+
+    def test_attributes_is_person_and_is_group_use_class_masks(self) -> None:
+        """Test attribute person/group checks match mixed-case objectClass values."""
+        person_attrs = FlextLdifAttributes(data={"objectClass": ["inetOrgPerson"]})
+        group_attrs = FlextLdifAttributes(data={"objectClass": ["groupOfNames"]})
+        assert person_attrs.is_person()
+        assert not person_attrs.is_group()
+        assert group_attrs.is_group()
+        assert not group_attrs.is_person()
+
     def test_get_attribute_values_success(
         self, sample_entry_data: dict[str, object]
     ) -> None:
@@ -613,6 +676,15 @@ description: With multiple descriptions"""
         )
         assert dn.get_depth() == 4
 
+    def test_dn_depth_is_cached(self) -> None:
+        """Test DN depth is computed once and reused."""
+        dn = FlextLdifDistinguishedName.model_validate(
+            {"value": "ou=people,dc=example,dc=com"},
+        )
+        assert dn.depth == 3
+        assert "depth" in dn.__dict__
+        assert dn.depth == dn.get_depth()
+
     def test_dn_equality_with_string(self) -> None:
         """Test DN equality with string."""
         dn = FlextLdifDistinguishedName.model_validate(